@@ -0,0 +1,63 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, TypeVar, Generic
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from world import SimpleOutcome, SimpleWorld, UmbrellaAction, WeatherObservation
+
+
+K = TypeVar('K')
+
+
+class AliasSampler(Generic[K]):
+    """Walker alias table (Vose's construction) for O(1) draws from a fixed distribution."""
+
+    __slots__ = ('keys', 'prob', 'alias')
+
+    def __init__(self, weighted: Iterable[tuple[K, float]]):
+        pairs = tuple(weighted)
+        if not pairs:
+            raise ValueError("Cannot sample from an empty distribution")
+        keys, weights = zip(*pairs)
+        n = len(weights)
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("Distribution weights must have a positive total")
+        scaled = [w * n / total for w in weights]
+
+        self.keys: tuple[K, ...] = keys
+        self.prob = array('d', [1.0]) * n
+        self.alias = array('i', range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left over is (up to rounding) exactly full
+
+    def sample(self, rng: np.random.Generator) -> K:
+        # A single uniform draw picks both the column and the coin flip within it
+        u = rng.random() * len(self.keys)
+        i = int(u)
+        return self.keys[i] if u - i < self.prob[i] else self.keys[self.alias[i]]
+
+
+def sample_observation(world: 'SimpleWorld', rng: np.random.Generator) -> 'WeatherObservation':
+    return world.observation_sampler.sample(rng)
+
+
+def sample_outcome(
+    world: 'SimpleWorld',
+    observation: 'WeatherObservation',
+    action: 'UmbrellaAction',
+    rng: np.random.Generator,
+) -> 'SimpleOutcome':
+    outcomes, cum = world.outcome_sampler(observation, action)
+    return outcomes[bisect_right(cum, rng.random())]
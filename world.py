@@ -0,0 +1,229 @@
+from array import array
+from functools import cached_property
+from typing import TypeVar, Generic, NamedTuple, Protocol, Self
+
+import numpy as np
+
+from sampling import AliasSampler
+
+
+class Showable(Protocol):
+    __slots__ = ()
+
+    def show(self) -> str:
+        ...
+
+
+ObsT = TypeVar('ObsT', bound=Showable)
+OutT = TypeVar('OutT', bound='Outcome')
+
+
+class Actionable(Showable, Protocol[OutT]):
+    __slots__ = ()
+
+    @classmethod
+    def all_possibilities(cls, obs: ObsT) -> frozenset[Self]:
+        ...
+
+
+ActT = TypeVar('ActT', bound=Actionable)
+
+
+# Outcome and World are plain base classes: subclasses override every method,
+# and structurally Outcome still satisfies Showable for the type checker.
+class Outcome:
+    __slots__ = ()
+
+    def show(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def reward(self) -> float:
+        raise NotImplementedError
+
+
+class World(Generic[ObsT, ActT, OutT]):
+    @property
+    def observation_distribution(self) -> dict[ObsT, float]:
+        """Probability distribution over observations."""
+        raise NotImplementedError
+
+    def marginal_outcome_distribution(
+        self,
+        observation: ObsT,
+        action: ActT,
+    ) -> dict[OutT, float]:
+        """Conditional outcome distribution given an observation and action."""
+        raise NotImplementedError
+
+
+# Concrete implementations
+class WeatherObservation:
+    __slots__ = ('description', '_h', 'idx')
+
+    def __init__(self, description: str, idx: int):
+        self.description = description
+        self._h = hash(description)
+        self.idx = idx
+
+    def show(self) -> str:
+        return self.description
+
+    def __hash__(self):
+        return self._h
+
+    def __eq__(self, other):
+        return self is other
+
+    # Instances are interned and immutable, so copies (e.g. Streamlit's deepcopy of widget values) keep identity
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+CLOUDY = WeatherObservation("Cloudy", 0)
+CLEAR = WeatherObservation("Clear", 1)
+
+
+class UmbrellaAction(Actionable[WeatherObservation]):
+    __slots__ = ('description', '_h', 'idx')
+
+    def __init__(self, description: str, idx: int):
+        self.description = description
+        self._h = hash(description)
+        self.idx = idx
+
+    def show(self) -> str:
+        return self.description
+
+    def __hash__(self):
+        return self._h
+
+    def __eq__(self, other):
+        return self is other
+
+    # Instances are interned and immutable, so copies (e.g. Streamlit's deepcopy of widget values) keep identity
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def all_possibilities(cls, obs: WeatherObservation) -> frozenset['UmbrellaAction']:
+        return _ALL_UMBRELLA_ACTIONS
+
+TAKE = UmbrellaAction("Take Umbrella", 0)
+DONT_TAKE = UmbrellaAction("Don't Take Umbrella", 1)
+_ALL_UMBRELLA_ACTIONS = frozenset({TAKE, DONT_TAKE})
+
+
+class SimpleOutcome(Outcome):
+    __slots__ = ('description', '_reward', '_h')
+
+    def __init__(self, description: str, reward: float):
+        self.description = description
+        self._h = hash(description)
+        self._reward = reward
+
+    def show(self) -> str:
+        return self.description
+
+    @property
+    def reward(self) -> float:
+        return self._reward
+
+    def __hash__(self):
+        return self._h
+
+    def __eq__(self, other):
+        return self is other
+
+    # Instances are interned and immutable, so copies (e.g. Streamlit's deepcopy of widget values) keep identity
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+_OUTCOME_INTERN: dict[str, SimpleOutcome] = {}
+
+
+def intern_outcome(description: str, reward: float) -> SimpleOutcome:
+    """Return the shared SimpleOutcome for this description, creating it on first use."""
+    interned = _OUTCOME_INTERN.get(description)
+    if interned is None:
+        interned = _OUTCOME_INTERN[description] = SimpleOutcome(description, reward)
+    return interned
+
+
+class _DistRec(NamedTuple):
+    distribution: dict[SimpleOutcome, float]
+    sampler: tuple[tuple[SimpleOutcome, ...], array]
+
+
+_EMPTY_DIST_REC = _DistRec({}, ((), array('d')))
+
+
+class SimpleWorld(World[WeatherObservation, UmbrellaAction, SimpleOutcome]):
+    def __init__(self, obs_distribution: dict[WeatherObservation, float],
+                 outcomes: dict[tuple[WeatherObservation, UmbrellaAction], dict[SimpleOutcome, float]]):
+        self._obs_distribution = obs_distribution
+        self._outcomes = outcomes
+
+        # Outcome distributions and their samplers, indexed by [observation.idx][action.idx]
+        n_obs = 1 + max((observation.idx for observation, _ in outcomes), default=-1)
+        n_act = 1 + max((action.idx for _, action in outcomes), default=-1)
+        self._table: list[list[_DistRec]] = [[_EMPTY_DIST_REC] * n_act for _ in range(n_obs)]
+        for (observation, action), distribution in outcomes.items():
+            if not distribution:
+                continue
+            # Normalized once here, so sampling is a single bisect of a uniform draw
+            cum = np.cumsum(np.fromiter(distribution.values(), dtype=np.float64, count=len(distribution)))
+            if cum[-1] <= 0:
+                raise ValueError(
+                    f"Outcome weights for ({observation.show()}, {action.show()}) must have a positive total"
+                )
+            cum /= cum[-1]
+            cum[-1] = 1.0
+            self._table[observation.idx][action.idx] = _DistRec(distribution, (tuple(distribution), array('d', cum)))
+
+    @property
+    def observation_distribution(self) -> dict[WeatherObservation, float]:
+        return self._obs_distribution
+
+    @cached_property
+    def observation_sampler(self) -> AliasSampler[WeatherObservation]:
+        return AliasSampler(self._obs_distribution.items())
+
+    def marginal_outcome_distribution(
+        self,
+        observation: WeatherObservation,
+        action: UmbrellaAction
+    ) -> dict[SimpleOutcome, float]:
+        record = self._record(observation, action)
+        # A fresh dict on a miss, so callers never share (or mutate) the sentinel's
+        return {} if record is _EMPTY_DIST_REC else record.distribution
+
+    def outcome_sampler(
+        self,
+        observation: WeatherObservation,
+        action: UmbrellaAction
+    ) -> tuple[tuple[SimpleOutcome, ...], array]:
+        return self._record(observation, action).sampler
+
+    def _record(self, observation: WeatherObservation, action: UmbrellaAction) -> _DistRec:
+        # Pairs outside the table have no outcomes, like a missing key in the input dict
+        table = self._table
+        if observation.idx < len(table) and action.idx < len(table[0]):
+            return table[observation.idx][action.idx]
+        return _EMPTY_DIST_REC
+
+
+# Outcomes, shared through intern_outcome
+DRY_BY_UMBRELLA = intern_outcome("It rained but I stayed dry", 50)
+UNNECESSARY_BURDEN = intern_outcome("No rain, I took an unnecessary load", 70)
+SOAKED = intern_outcome("I got soaked", -100)
+LIGHT_AS_A_FEATHER = intern_outcome("No rain, light as a feather.", 100)